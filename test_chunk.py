@@ -1,9 +1,76 @@
 import os
-import csv
+import re
+import posixpath
+import sys
 import json
-from docx import Document
-from datetime import datetime
-import pymupdf4llm as pymu  # Library to handle PDF extraction
+import time
+from array import array
+
+# Segment types and importances, shared by every segment instead of being rebuilt for each one
+_TITLE = sys.intern('title')
+_SUBTITLE = sys.intern('subtitle')
+_PARAGRAPH = sys.intern('paragraph')
+_TITLE_IMPORTANCE = 2.0
+_SUBTITLE_IMPORTANCE = 1.8
+_MINOR_SUBTITLE_IMPORTANCE = 1.6  # Markdown headings of level 3 and deeper
+_PARAGRAPH_IMPORTANCE = 1.0
+
+try:
+    import orjson  # Optional, much faster JSON encoder; the standard json module is used when it is missing
+except ImportError:
+    orjson = None
+
+# Markdown heading line (e.g. "## Subtitle ##"): group 1 holds the '#' run, group 2 the rest of the line. The closing
+# '#' sequence is stripped in Python, an optional trailing group in the pattern backtracks quadratically on long blanks
+_HEADING_RE = re.compile(r'^[ \t]*(#{1,6})[ \t]+(.*)$', re.MULTILINE)
+# (segment type, importance) of Markdown headings indexed by level: '#' is a title, deeper levels are subtitles
+_MARKDOWN_HEADINGS = (
+    None,
+    (_TITLE, _TITLE_IMPORTANCE),
+    (_SUBTITLE, _SUBTITLE_IMPORTANCE),
+) + ((_SUBTITLE, _MINOR_SUBTITLE_IMPORTANCE),) * 4  # Treat any heading level 3+ as a subtitle
+# Non-empty line with its surrounding whitespace excluded from group 1
+_TEXT_LINE_RE = re.compile(r'^[^\S\n]*(\S(?:[^\n]*\S)?)', re.MULTILINE)
+# Characters that force a CSV field to be quoted (same rule as csv.QUOTE_MINIMAL)
+_CSV_QUOTE_RE = re.compile(r'[",\r\n]')
+# Size, in characters, of the blocks written to the CSV file
+_CSV_BLOCK_SIZE = 2**20
+# Position of each segment type in the hierarchical JSON (paragraphs are the default)
+_JSON_KINDS = {_TITLE: 0, _SUBTITLE: 1}
+
+# WordprocessingML tags and attributes used when streaming DOCX files
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_BODY = _W_NS + 'body'
+_W_P = _W_NS + 'p'
+_W_R = _W_NS + 'r'
+_W_HYPERLINK = _W_NS + 'hyperlink'
+_W_T = _W_NS + 't'
+_W_BR = _W_NS + 'br'
+_W_STYLE = _W_NS + 'style'
+_W_VAL = _W_NS + 'val'
+_W_TYPE = _W_NS + 'type'
+_W_DEFAULT = _W_NS + 'default'
+_W_STYLE_ID = _W_NS + 'styleId'
+_W_NAME = _W_NS + 'name'
+_W_PSTYLE_PATH = f'{_W_NS}pPr/{_W_NS}pStyle'
+# Package relationships locating the DOCX parts (the main part is not always named word/document.xml)
+_REL_RELATIONSHIP = '{http://schemas.openxmlformats.org/package/2006/relationships}Relationship'
+_REL_OFFICE_DOCUMENT = '/officeDocument'
+_REL_STYLES = '/styles'
+# Run elements rendered as a single character in the paragraph text
+_W_RUN_CHARS = {
+    _W_NS + 'tab': '\t',
+    _W_NS + 'ptab': '\t',
+    _W_NS + 'cr': '\n',
+    _W_NS + 'noBreakHyphen': '-',
+}
+# Whitespace normalization of DOCX text: non-breaking spaces become spaces, zero-width spaces are removed
+_NBSP_TABLE = str.maketrans({'\u00A0': ' ', '\u202F': ' ', '\u200B': None})
+# Heading style names mapped to their (segment type, importance): Heading 1 is a title, deeper levels are subtitles
+_DOCX_HEADING_STYLES = {
+    f'heading {level}': (_TITLE, _TITLE_IMPORTANCE) if level == 1 else (_SUBTITLE, _SUBTITLE_IMPORTANCE)
+    for level in range(1, 10)
+}
 
 
 class Segment:
@@ -16,6 +83,9 @@ class Segment:
     :return: A Segment object
     """
 
+    # No per-instance __dict__: documents can produce tens of thousands of segments
+    __slots__ = ('text', 'segment_type', 'importance')
+
     def __init__(self, text, segment_type, importance=1.0):
         self.text = text
         self.segment_type = segment_type
@@ -31,235 +101,413 @@ class DocumentSegmenter:
 
     :param file_path: The path to the file to be processed
     :param output_dir: Directory where the CSV files will be saved
+    :param save_format: The output format, 'csv' or 'json' (default is 'csv')
+    :param page_workers: Number of processes converting PDF pages in parallel (default is 1, no worker process).
+                         Values above 1 need the calling script to be guarded by `if __name__ == "__main__":`
     :return: A DocumentSegmenter object
 
     EXAMPLE USAGE:
     file_path = r'data/original/your_document_to_chunk.pdf' or document.docx  # Replace with your file path
     output_dir = 'data/chunk'  # Folder to save the CSV file; the folder will be created if it doesn't exist
     """
-    def __init__(self, file_path, output_dir, save_format='csv'):
+    def __init__(self, file_path, output_dir, save_format='csv', page_workers=1):
 
         # Validate the save format (only 'csv' or 'json' are allowed)
         if save_format.lower() not in ['csv', 'json']:
             raise ValueError(f"Unsupported save format: {save_format}")
         self.save_format = save_format.lower()
 
-        # Ensure the directory of the file to chunk exists
-        directory_path = os.path.dirname(file_path)
-        self._ensure_directory_exists(directory_path)
+        # Validate the number of PDF page workers (bool is excluded, although it is a subclass of int)
+        if isinstance(page_workers, bool) or not isinstance(page_workers, int) or page_workers < 1:
+            raise ValueError(f"page_workers must be an integer greater than or equal to 1, got {page_workers!r}")
 
         # Ensure the output directory exists
         self._ensure_directory_exists(output_dir)
         self.output_dir = output_dir
-        
-        # Check if the input file exists after creating the directory (if necessary)
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"The file {file_path} does not exist.")
+
+        # Check once that the input file exists; the loaders rely on this check
+        try:
+            os.stat(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"The file {file_path} does not exist.") from None
         self.file_path = file_path
+        self.page_workers = page_workers
         
-        # Determine the file extension and initialize segments list
-        self.file_extension = os.path.splitext(file_path)[-1].lower()
-        self.segments = []
+        # Split the file name once: the base name names the output file, the extension selects the loader
+        self.base_filename, file_extension = os.path.splitext(os.path.basename(file_path))
+        self.file_extension = file_extension.lower()
+
+        # Segments are stored as three parallel columns (types, texts, importances) rather than a list of objects
+        self._types = []
+        self._texts = []
+        self._importances = array('d')
+
+    @property
+    def segments(self):
+        """
+        The detected segments, rebuilt as Segment objects from the segment columns.
+
+        :return: A list of Segment objects in document order
+        """
+        return [Segment(text, segment_type, importance)
+                for segment_type, text, importance in zip(self._types, self._texts, self._importances)]
 
     def _ensure_directory_exists(self, directory_path):
         """
         Ensures that a directory exists, creating it if necessary.
         :param directory_path: The path to the directory that needs to be checked/created
         """
-        if not os.path.exists(directory_path):
+        # Try to create the directory directly instead of checking for it first (one syscall less on the usual path)
+        try:
             os.makedirs(directory_path)
             print(f"Directory created: {directory_path}")
-        else:
+        except FileExistsError:
             print(f"Directory already exists: {directory_path}")
 
     def _load_document(self):
         """
-        Loads the document based on its file type (DOCX, PDF, TXT) and returns its content as plain text or Markdown.
+        Loads the document based on its file type (TXT) and returns its content as plain text lines.
+        DOCX and PDF files are not loaded as a whole; they are streamed by _iter_docx_paragraphs and _load_pdf.
 
-        :return: Plain text or Markdown representation of the document
+        :return: An iterable of the plain text lines of the document
         """
-        if not os.path.exists(self.file_path):
-            raise FileNotFoundError(f"The file {self.file_path} does not exist.")
-
-        if self.file_extension == '.docx':
-            return self._load_docx()
-        elif self.file_extension == '.pdf':
-            return self._load_pdf()
-        elif self.file_extension == '.txt':
+        if self.file_extension == '.txt':
             return self._load_txt()
         else:
             raise ValueError(f"Unsupported file format: {self.file_extension}")
 
-    def _load_docx(self):
+    def _find_docx_part(self, archive, source_part, rel_type):
+        """
+        Finds the name of a DOCX part from the relationships of its source part, as python-docx does.
+
+        :param archive: The DOCX file opened as a zip archive
+        :param source_part: The name of the part owning the relationship ('' for the package itself)
+        :param rel_type: The end of the relationship type (e.g. '/officeDocument')
+        :return: The name of the target part in the archive, or None if there is no such relationship
         """
-        Loads a DOCX file and returns its content as plain text.
+        from lxml import etree  # Library to parse the XML parts of DOCX files
 
-        :return: The plain text content of the document
+        source_dir, source_name = posixpath.split(source_part)
+        rels_name = posixpath.join(source_dir, '_rels', source_name + '.rels')
+        if rels_name not in archive.namelist():
+            return None
+
+        with archive.open(rels_name) as rels_xml:
+            for rel in etree.parse(rels_xml).getroot().iter(_REL_RELATIONSHIP):
+                if rel.get('Type', '').endswith(rel_type) and rel.get('TargetMode') != 'External':
+                    # Targets are relative to the source part's folder, or absolute when they start with '/'
+                    target = rel.get('Target', '')
+                    if not target.startswith('/'):
+                        target = posixpath.join('/', source_dir, target)
+                    return posixpath.normpath(target).lstrip('/')
+        return None
+
+    def _load_docx_styles(self, archive, document_part):
+        """
+        Reads the paragraph style names of a DOCX file from its styles part.
+
+        :param archive: The DOCX file opened as a zip archive
+        :param document_part: The name of the main document part, whose relationships locate the styles part
+        :return: A dict mapping style IDs to lowercase style names; the default paragraph style is stored under None
+        """
+        from lxml import etree  # Library to parse the XML parts of DOCX files
+
+        styles = {None: 'normal'}
+        styles_part = self._find_docx_part(archive, document_part, _REL_STYLES)
+        if styles_part is None or styles_part not in archive.namelist():
+            return styles
+
+        with archive.open(styles_part) as styles_xml:
+            for style in etree.parse(styles_xml).getroot().iter(_W_STYLE):
+                if style.get(_W_TYPE) != 'paragraph':
+                    continue
+                name = style.find(_W_NAME)
+                style_name = (name.get(_W_VAL) if name is not None else style.get(_W_STYLE_ID, '')).lower()
+                styles[style.get(_W_STYLE_ID)] = style_name
+                if style.get(_W_DEFAULT) in ('1', 'true', 'on'):
+                    styles[None] = style_name
+        return styles
+
+    def _get_docx_paragraph_text(self, para):
         """
-        doc = Document(self.file_path)
-        # Convert all paragraphs into a single string joined by newlines
-        return "\n".join([para.text for para in doc.paragraphs])
+        Rebuilds the text of a DOCX paragraph from its runs (text, tabs and line breaks).
+
+        Only the runs of the paragraph itself and of its hyperlinks are read, as python-docx does: runs nested in
+        drawings or text boxes belong to those objects (Word also stores each text box twice, with a VML fallback).
+
+        :param para: The <w:p> element of the paragraph
+        :return: The plain text of the paragraph
+        """
+        parts = []
+        for child in para.iterchildren(_W_R, _W_HYPERLINK):
+            runs = child.iterchildren(_W_R) if child.tag == _W_HYPERLINK else (child,)
+            for run in runs:
+                for element in run:
+                    if element.tag == _W_T:
+                        parts.append(element.text or '')
+                    elif element.tag == _W_BR:
+                        # Only text-wrapping breaks are part of the text; page and column breaks are not
+                        if element.get(_W_TYPE, 'textWrapping') == 'textWrapping':
+                            parts.append('\n')
+                    else:
+                        parts.append(_W_RUN_CHARS.get(element.tag, ''))
+        return "".join(parts)
+
+    def _iter_docx_paragraphs(self):
+        """
+        Streams the body paragraphs of a DOCX file with their style, reading its main document part in a single pass.
+
+        Parsed paragraphs are released as soon as they are yielded, so memory stays bounded for large documents.
+
+        :return: A generator of (style name, text) tuples, one per paragraph
+        """
+        # Imported here so that PDF and TXT runs do not pay for loading lxml and zipfile
+        import zipfile
+        from lxml import etree  # Library to stream the XML parts of DOCX files
+
+        try:
+            with zipfile.ZipFile(self.file_path) as archive:
+                # The main part is usually word/document.xml, but e.g. Word Online names it word/document2.xml
+                document_part = self._find_docx_part(archive, '', _REL_OFFICE_DOCUMENT)
+                if document_part is None:
+                    raise KeyError("There is no main document part in the package relationships")
+                styles = self._load_docx_styles(archive, document_part)
+
+                with archive.open(document_part) as document_xml:
+                    for _, para in etree.iterparse(document_xml, tag=_W_P):
+                        body = para.getparent()
+                        if body.tag != _W_BODY:
+                            continue  # Paragraphs inside tables, text boxes, etc. are not body paragraphs
+
+                        style = para.find(_W_PSTYLE_PATH)
+                        style_name = styles.get(style.get(_W_VAL) if style is not None else None, styles[None])
+                        yield style_name, self._get_docx_paragraph_text(para)
+
+                        # Drop the paragraph and every element parsed before it
+                        para.clear()
+                        while para.getprevious() is not None:
+                            del body[0]
+        except (KeyError, zipfile.BadZipFile, etree.XMLSyntaxError) as e:
+            raise ValueError(f"Error reading the DOCX file: {e}") from e
 
     def _load_pdf(self):
         """
-        Uses pymupdf4llm to extract text from a PDF file and convert it to Markdown.
+        Uses pymupdf4llm to extract text from a PDF file and convert it to Markdown, one page at a time.
+
+        The heading font sizes are identified once for the whole document, so every page is converted with
+        the same heading levels. Pages are converted by up to `page_workers` processes and yielded in order.
 
-        :return: The converted Markdown text from the PDF
+        :return: A generator of the Markdown text of each page
         """
+        # Imported here so that DOCX and TXT runs do not pay for loading PyMuPDF
+        import pymupdf  # PyMuPDF, installed as a dependency of pymupdf4llm
+        import pymupdf4llm as pymu  # Library to handle PDF extraction
+
         try:
-            return pymu.to_markdown(self.file_path)  # Converts the PDF content to Markdown
+            with pymupdf.open(self.file_path) as doc:
+                hdr_info = pymu.IdentifyHeaders(doc)
+                page_count = doc.page_count
+                if self.page_workers <= 1 or page_count <= 1:
+                    for page_number in range(page_count):
+                        # Converts one PDF page to Markdown
+                        yield pymu.to_markdown(doc, pages=[page_number], hdr_info=hdr_info, show_progress=False)
+                    return
+
+            # The conversion is CPU-bound in PyMuPDF, so pages are spread over processes rather than threads
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=min(self.page_workers, page_count),
+                                     initializer=_init_pdf_worker, initargs=(self.file_path, hdr_info)) as executor:
+                yield from executor.map(_convert_pdf_page, range(page_count), chunksize=4)
         except Exception as e:
-            print(f"Error reading the PDF file: {e}")
-            return None
+            raise ValueError(f"Error reading the PDF file: {e}") from e
 
     def _load_txt(self):
         """
-        Reads a TXT file and returns its content as plain text.
+        Reads a TXT file line by line through a 1 MiB buffer, without holding its whole content in memory.
 
-        :return: The plain text content of the TXT file
+        :return: A generator of the lines of the TXT file
         """
-        with open(self.file_path, 'r', encoding='utf-8') as file:
-            return file.read()
+        with open(self.file_path, 'r', encoding='utf-8', buffering=2**20) as file:
+            yield from file
 
     def _segment_document(self):
         """
-        Segments the loaded document based on text styles and content type (title, subtitle, paragraph).
-        The segmentation is determined differently for DOCX, PDF, and TXT.
+        Segments the loaded document based on text styles and content type (title, subtitle, paragraph)
+        and stores the segments in the segment columns.
         """
-        text = self._load_document()
-        if text is None:
-            raise ValueError("Unable to load the document content.")
+        append_type = self._types.append
+        append_importance = self._importances.append
+        append_text = self._texts.append
+        for segment_type, importance, text in self._iter_segments():
+            append_type(segment_type)
+            append_importance(importance)
+            append_text(text)
+
+    def _iter_segments(self):
+        """
+        Segments the document while it is read, based on text styles and content type (title, subtitle, paragraph).
+        The segmentation is determined differently for DOCX, PDF, and TXT.
 
-        # Call appropriate segmentation method based on file extension
+        :return: A generator of (segment type, importance, text) tuples in document order
+        """
+        # DOCX and PDF files are segmented while they are read, without loading the whole text first
         if self.file_extension == '.docx':
-            self._segment_docx(text)
+            return self._segment_docx()
         elif self.file_extension == '.pdf':
-            self._segment_pdf(text)
+            return self._stream_pdf_segments()
         else:
-            self._segment_plain_text(text)  # Default segmentation for TXT
+            return self._segment_plain_text(self._load_document())  # Default segmentation for TXT
 
-    def _segment_pdf(self, markdown_text):
+    def _stream_pdf_segments(self):
         """
-        Segments a PDF document that has been converted to Markdown by detecting titles, subtitles, and paragraphs.
+        Segments a PDF document one page of Markdown at a time, each page being converted only when it is needed.
 
-        This method uses Markdown symbols (#, ##, etc.) to identify different levels of headings and segments the content accordingly.
+        A paragraph that runs over a page break is carried over to the next page until a heading closes it.
 
-        :param markdown_text: The Markdown text extracted from the PDF
-        """
-        current_segment_type = "paragraph"
-        current_importance = 1.0
-        current_text = ""
-
-        # Iterate through each line of the markdown text
-        for line in markdown_text.splitlines():
-            line = line.strip()  # Remove leading/trailing whitespace
-
-            if not line:  # Skip empty lines
-                continue
-
-            # Detect titles based on the Markdown heading symbols (e.g., # for title, ## for subtitle)
-            if line.startswith('#'):
-                # If a paragraph was being built, append it before switching segment type
-                if current_text and current_segment_type == "paragraph":
-                    self.segments.append(Segment(current_text.strip(), current_segment_type, current_importance))
-                    current_text = ""
-
-                # Count the number of '#' to determine heading level
-                level = len(line.split(' ')[0])
-
-                # Set segment type and importance based on heading level
-                if level == 1:
-                    current_segment_type = 'title'
-                    current_importance = 2.0
-                elif level == 2:
-                    current_segment_type = 'subtitle'
-                    current_importance = 1.8
-                else:
-                    current_segment_type = 'subtitle'  # Treat any heading level 3+ as a subtitle
-                    current_importance = 1.6
-
-                # Append the detected title/subtitle to the segments
-                self.segments.append(Segment(line.strip('#').strip(), current_segment_type, current_importance))
-                current_segment_type = "paragraph"  # Reset for the next paragraph
-                current_importance = 1.0
-
-            else:
-                # Collect text for paragraphs
-                current_text += line + " "
+        :return: A generator of (segment type, importance, text) tuples
+        """
+        pending = []
+        for page_text in self._load_pdf():
+            yield from self._segment_pdf(page_text, pending)
 
         # Add any remaining paragraph text to the segments
-        if current_text.strip():
-            self.segments.append(Segment(current_text.strip(), "paragraph", 1.0))
+        if pending:
+            yield _PARAGRAPH, _PARAGRAPH_IMPORTANCE, " ".join(pending)
+
+    def _segment_pdf(self, markdown_text, pending):
+        """
+        Segments a PDF document that has been converted to Markdown by detecting titles, subtitles, and paragraphs.
+
+        This method uses Markdown symbols (#, ##, etc.) to identify different levels of headings and segments the content accordingly.
+        It can be called once per page: the paragraph still open at the end of the text is kept in `pending`.
 
-    def _segment_docx(self, text):
+        :param markdown_text: The Markdown text extracted from the PDF (or from one of its pages)
+        :param pending: The lines of the paragraph left open by the previous call, updated in place
+        :return: A generator of (segment type, importance, text) tuples
+        """
+        previous_end = 0
+
+        # Scan the whole Markdown buffer for headings; the text between two headings forms a paragraph
+        for match in _HEADING_RE.finditer(markdown_text):
+            # Paragraph lines are stripped and joined with a single space; the scan works on offsets of the buffer,
+            # so only the non-empty lines are copied, never the text between the headings
+            pending.extend(_TEXT_LINE_RE.findall(markdown_text, previous_end, match.start()))
+            if pending:
+                yield _PARAGRAPH, _PARAGRAPH_IMPORTANCE, " ".join(pending)
+                pending.clear()
+
+            # The number of '#' determines the heading level, which sets the segment type and importance
+            segment_type, importance = _MARKDOWN_HEADINGS[match.end(1) - match.start(1)]
+
+            # Drop the optional closing '#' sequence, which must be preceded by a blank (e.g. "C#" is kept)
+            heading_text = match.group(2).rstrip()
+            without_closing = heading_text.rstrip('#')
+            if without_closing.endswith((' ', '\t')):
+                heading_text = without_closing.rstrip()
+
+            # Yield the detected title/subtitle
+            yield segment_type, importance, heading_text
+            previous_end = match.end()
+
+        # Keep the text after the last heading open, the next page may continue it
+        pending.extend(_TEXT_LINE_RE.findall(markdown_text, previous_end))
+
+    def _segment_docx(self):
         """
         Segments a DOCX document by detecting titles, subtitles, and paragraphs based on text styles (e.g., Heading 1, Heading 2).
 
         This method ensures that titles and subtitles are properly identified based on their style level in DOCX.
+        The paragraphs are read with _iter_docx_paragraphs, so the file is parsed only once.
 
-        :return: A list of detected segments (title, subtitle, paragraph)
+        :return: A generator of (segment type, importance, text) tuples
         """
-        doc = Document(self.file_path)
-        current_text = ""
-        current_segment_type = "paragraph"
-        current_importance = 1.0
+        current_buf = []
+        # Bind the hot-loop method once
+        collect = current_buf.append
 
         # Iterate through each paragraph in the DOCX file
-        for para in doc.paragraphs:
-            # Replace non-breaking spaces and strip excess whitespace
-            line = para.text.replace('\u00A0', ' ').strip()
+        for style_name, para_text in self._iter_docx_paragraphs():
+            # Replace non-breaking spaces, drop zero-width spaces and strip excess whitespace
+            line = para_text.translate(_NBSP_TABLE).strip()
 
             if not line:
                 continue  # Skip empty paragraphs
 
             # Detect titles and subtitles based on heading levels
-            if para.style.name.startswith('Heading'):  # Title or subtitle
-                if current_text and current_segment_type == 'paragraph':
-                    # Save the current paragraph before switching segment type
-                    self.segments.append(Segment(current_text, current_segment_type, current_importance))
-
-                # Determine if it's a title or subtitle based on heading level
-                level = int(para.style.name.split()[1])
-                current_segment_type = 'title' if level == 1 else 'subtitle'
-                current_importance = 2.0 if level == 1 else 1.8
-                self.segments.append(Segment(line, current_segment_type, current_importance))
-
-                # Reset for the next paragraph
-                current_text = ""
-                current_segment_type = "paragraph"
-                current_importance = 1.0
+            heading = _DOCX_HEADING_STYLES.get(style_name)
+            if heading is not None:  # Title or subtitle
+                if current_buf:
+                    # Yield the current paragraph before the heading
+                    yield _PARAGRAPH, _PARAGRAPH_IMPORTANCE, " ".join(current_buf)
+                    current_buf.clear()
+
+                segment_type, importance = heading
+                yield segment_type, importance, line
             else:
-                # Concatenate the line to the current paragraph
-                current_text += line + " "
+                # Collect the line for the current paragraph
+                collect(line)
 
         # Add any remaining paragraph text to the segments
-        if current_text:
-            self.segments.append(Segment(current_text.strip(), current_segment_type, current_importance))
+        if current_buf:
+            yield _PARAGRAPH, _PARAGRAPH_IMPORTANCE, " ".join(current_buf)
 
     def _segment_plain_text(self, text):
         """
         Segments plain text by splitting it into paragraphs.
-        This method is also used for PDFs that are converted to Markdown.
+        Each non-empty line becomes a paragraph, stripped of surrounding whitespace.
 
-        :param text: The plain text content to be segmented
+        :param text: The plain text content to be segmented, either as a string or as an iterable of lines
+        :return: A generator of (segment type, importance, text) tuples
         """
-        paragraphs = text.split("\n")
-        for paragraph in paragraphs:
-            if paragraph.strip():  # Skip empty lines
-                self.segments.append(Segment(paragraph.strip(), "paragraph", 1.0))
-
-    def _save_segments_to_csv(self, output_chunk_save):
+        if isinstance(text, str):
+            for line in _TEXT_LINE_RE.findall(text):
+                yield _PARAGRAPH, _PARAGRAPH_IMPORTANCE, line
+            return
+
+        # Lines are streamed (e.g. from _load_txt), so they are segmented one at a time
+        for line in text:
+            line = line.strip()
+            if line:
+                yield _PARAGRAPH, _PARAGRAPH_IMPORTANCE, line
+
+    def _save_segments_to_csv(self, output_chunk_save, segments=None):
         """
         Saves the detected segments into a CSV file.
 
+        The schema is fixed (segment type, importance, text), so rows are formatted directly instead of going
+        through csv.writer; the output is the same as csv.writer's default dialect (minimal quoting, CRLF line endings).
+
         :param output_chunk_save: The name of the output CSV file
+        :param segments: An iterable of (segment type, importance, text) tuples, e.g. from _iter_segments
+                         (default is the segments already stored in the segment columns)
         """
+        if segments is None:
+            segments = zip(self._types, self._importances, self._texts)
+
         output_csv_path = os.path.join(self.output_dir, output_chunk_save)
-        with open(output_csv_path, mode='w', newline='', encoding='utf-8') as file:
-            writer = csv.writer(file)
-            writer.writerow(['Segment Type', 'Importance', 'Text'])
-            for segment in self.segments:
-                writer.writerow([segment.segment_type, segment.importance, segment.text])
+        try:
+            with open(output_csv_path, mode='w', newline='', encoding='utf-8') as file:
+                rows = ['Segment Type,Importance,Text\r\n']
+                size = 0
+                for segment_type, importance, text in segments:
+                    # Only the text can contain delimiters, quotes or line breaks; most texts need no quoting
+                    if _CSV_QUOTE_RE.search(text):
+                        text = '"' + text.replace('"', '""') + '"'
+                    rows.append(f'{segment_type},{importance},{text}\r\n')
+                    size += len(text)
+
+                    # Write the accumulated rows in blocks of about 1 MiB
+                    if size >= _CSV_BLOCK_SIZE:
+                        file.write(''.join(rows))
+                        rows.clear()
+                        size = 0
+                file.write(''.join(rows))
+        except BaseException:
+            # Do not leave a truncated CSV file behind when the segmentation fails midway
+            if os.path.exists(output_csv_path):
+                os.remove(output_csv_path)
+            raise
 
     def _save_segments_to_hierarchical_json(self, output_chunk_save):
         """
@@ -274,41 +522,44 @@ class DocumentSegmenter:
         current_title = None
         current_subtitle = None
 
+        # Classify every segment once: 0 for titles, 1 for subtitles, 2 for paragraphs
+        kinds = [_JSON_KINDS.get(segment_type, 2) for segment_type in self._types]
+
         # Iterate through each segment and build the hierarchy
-        for segment in self.segments:
-            # Use match-case introduced in Python 3.10 for cleaner structure
-            match segment.segment_type:
-                case 'title':
-                    # If it's a title, start a new section
-                    current_title = {
-                        "Title": segment.text,
-                        "Subtitles": []  # Subtitles will be stored here
-                    }
-                    json_data.append(current_title)
-                    current_subtitle = None  # Reset the subtitle for the new title
-
-                case 'subtitle':
-                    # If it's a subtitle, add it under the current title
-                    current_subtitle = {
-                        "Subtitle": segment.text,
-                        "Paragraphs": []  # Paragraphs will be stored under each subtitle
-                    }
-                    if current_title:
-                        current_title["Subtitles"].append(current_subtitle)
-
-                case 'paragraph':
-                    # If it's a paragraph, add it under the current subtitle if it exists, else under the title
-                    if current_subtitle:
-                        current_subtitle["Paragraphs"].append(segment.text)
-                    elif current_title:
-                        # If there's no subtitle, add the paragraph directly under the title
-                        if "Paragraphs" not in current_title:
-                            current_title["Paragraphs"] = []
-                        current_title["Paragraphs"].append(segment.text)
-
-        # Write the structured data to a JSON file
-        with open(output_json_path, 'w', encoding='utf-8') as file:
-            json.dump(json_data, file, ensure_ascii=False, indent=4)
+        for kind, text in zip(kinds, self._texts):
+            if kind == 2:
+                # If it's a paragraph, add it under the current subtitle if it exists, else under the title
+                if current_subtitle is not None:
+                    current_subtitle["Paragraphs"].append(text)
+                elif current_title is not None:
+                    current_title["Paragraphs"].append(text)
+
+            elif kind == 0:
+                # If it's a title, start a new section
+                current_title = {
+                    "Title": text,
+                    "Subtitles": [],  # Subtitles will be stored here
+                    "Paragraphs": []  # Paragraphs placed directly under the title will be stored here
+                }
+                json_data.append(current_title)
+                current_subtitle = None  # Reset the subtitle for the new title
+
+            else:
+                # If it's a subtitle, add it under the current title
+                current_subtitle = {
+                    "Subtitle": text,
+                    "Paragraphs": []  # Paragraphs will be stored under each subtitle
+                }
+                if current_title is not None:
+                    current_title["Subtitles"].append(current_subtitle)
+
+        # Write the structured data to a JSON file (both encoders produce the same UTF-8 output, indented by 2 spaces)
+        if orjson is not None:
+            with open(output_json_path, 'wb') as file:
+                file.write(orjson.dumps(json_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_json_path, 'w', encoding='utf-8') as file:
+                json.dump(json_data, file, ensure_ascii=False, indent=2)
 
         print(f"Segments have been saved in hierarchical JSON format at {output_json_path}")
 
@@ -337,23 +588,97 @@ class DocumentSegmenter:
         The main process for segmenting the document and saving the results into a CSV file.
 
         This function orchestrates the loading, segmenting, and saving of the document.
+        With the CSV format, the segments are written while the document is segmented and are not kept in `segments`.
         """
         try:
-            self._segment_document()
-
-            # Generate the CSV file name based on the original file name and current timestamp
-            base_filename = os.path.splitext(os.path.basename(self.file_path))[0]
-
             # Generate the output file name based on the original file name and current timestamp
-            output_chunk_create_name = f"{base_filename}_chunk_{datetime.today().strftime('%Y_%m_%d_%H_%M_%S')}.{self.save_format}"
+            output_chunk_create_name = f"{self.base_filename}_chunk_{time.strftime('%Y_%m_%d_%H_%M_%S')}.{self.save_format}"
 
-            # Save the segments to the appropriate format (CSV or JSON)
-            self._save_segments(output_chunk_name=output_chunk_create_name)
+            if self.save_format == 'csv':
+                # Stream the segments straight into the CSV file, so they are never all held in memory
+                self._save_segments_to_csv(output_chunk_create_name, self._iter_segments())
+            else:
+                # The hierarchical JSON needs every segment before it can be built
+                self._segment_document()
+
+                # Save the segments to the appropriate format (CSV or JSON)
+                self._save_segments(output_chunk_name=output_chunk_create_name)
             print(f"Segments have been saved in {os.path.join(self.output_dir, output_chunk_create_name)}")
 
         except ValueError as e:
             print(f"Processing error: {e}")
 
+    @classmethod
+    def process_many(cls, file_paths, output_dir, save_format='csv', max_workers=None):
+        """
+        Segments several documents in parallel, each one being processed by a worker process.
+
+        :param file_paths: The paths to the files to be processed
+        :param output_dir: Directory where the output files will be saved
+        :param save_format: The output format ('csv' or 'json') used for every file
+        :param max_workers: The number of worker processes (defaults to the number of CPUs)
+        :raises ValueError: If two files share the same base name, as their outputs would overwrite each other
+        """
+        # Output names derive from the base name only (report.pdf and report.docx both give report_chunk_...), and
+        # case-insensitive file systems treat Report and report as the same name
+        seen, duplicates = set(), set()
+        for path in file_paths:
+            stem = os.path.splitext(os.path.basename(path))[0].casefold()
+            if stem in seen:
+                duplicates.add(stem)
+            seen.add(stem)
+        if duplicates:
+            raise ValueError(
+                f"Files with the same base name cannot be processed together: {', '.join(sorted(duplicates))}")
+
+        # Imported here so that single-document runs do not pay for loading multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(_process_file, [(path, output_dir, save_format) for path in file_paths]))
+
+
+def _process_file(args):
+    """
+    Worker used by DocumentSegmenter.process_many to segment and save a single document.
+
+    The documents are already processed in parallel, so the PDF pages of each one are converted sequentially.
+
+    :param args: A (file_path, output_dir, save_format) tuple
+    """
+    file_path, output_dir, save_format = args
+    DocumentSegmenter(file_path, output_dir, save_format=save_format, page_workers=1).process()
+
+
+# PDF and heading info used by the page conversion worker processes, set once per process by _init_pdf_worker
+_worker_pdf = None
+_worker_hdr_info = None
+
+
+def _init_pdf_worker(file_path, hdr_info):
+    """
+    Initializer of the page conversion worker processes: opens the PDF once per process.
+
+    :param file_path: The path to the PDF file
+    :param hdr_info: The heading font sizes identified by the parent process for the whole document
+    """
+    global _worker_pdf, _worker_hdr_info
+    import pymupdf
+
+    _worker_pdf = pymupdf.open(file_path)
+    _worker_hdr_info = hdr_info
+
+
+def _convert_pdf_page(page_number):
+    """
+    Worker used by DocumentSegmenter._load_pdf to convert a single PDF page to Markdown.
+
+    :param page_number: The 0-based number of the page
+    :return: The Markdown text of the page
+    """
+    import pymupdf4llm as pymu
+
+    return pymu.to_markdown(_worker_pdf, pages=[page_number], hdr_info=_worker_hdr_info, show_progress=False)
 
 
 # Utilisation de la classe
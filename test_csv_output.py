@@ -0,0 +1,59 @@
+import csv
+import io
+import random
+
+import pytest
+
+import test_chunk
+from test_chunk import DocumentSegmenter
+
+
+def _segmenter(tmp_path):
+    txt_path = tmp_path / 'sample.txt'
+    txt_path.write_text('Title\nParagraph\n', encoding='utf-8')
+    return DocumentSegmenter(str(txt_path), str(tmp_path / 'chunk'))
+
+
+def _random_rows(rng):
+    alphabet = ['"', ',', '\r', '\n', '\t', ' ', 'a', 'Z', '0', 'é', ' ', '字', '😀']
+    return [(rng.choice(['title', 'subtitle', 'paragraph']), rng.choice([2.0, 1.8, 1.6, 1.0]),
+             ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 12))))
+            for _ in range(rng.randint(0, 20))]
+
+
+@pytest.mark.parametrize('block_size', [2**20, 8])
+def test_csv_output_matches_csv_writer(tmp_path, monkeypatch, block_size):
+    # A tiny block size also checks that rows are not lost or reordered when blocks are flushed
+    monkeypatch.setattr(test_chunk, '_CSV_BLOCK_SIZE', block_size)
+    segmenter = _segmenter(tmp_path)
+    rng = random.Random(0)
+
+    for _ in range(500):
+        rows = _random_rows(rng)
+        expected = io.StringIO(newline='')
+        writer = csv.writer(expected)
+        writer.writerow(['Segment Type', 'Importance', 'Text'])
+        writer.writerows(rows)
+
+        segmenter._save_segments_to_csv('out.csv', rows)
+        with open(tmp_path / 'chunk' / 'out.csv', encoding='utf-8', newline='') as file:
+            assert file.read() == expected.getvalue()
+
+
+def test_failed_streaming_leaves_no_partial_csv(tmp_path, monkeypatch):
+    monkeypatch.setattr(test_chunk, '_CSV_BLOCK_SIZE', 8)
+    segmenter = _segmenter(tmp_path)
+
+    def failing_segments():
+        for _ in range(10):
+            yield 'paragraph', 1.0, 'text written before the failure'
+        raise ValueError('Error reading the document')
+
+    with pytest.raises(ValueError):
+        segmenter._save_segments_to_csv('out.csv', failing_segments())
+    assert list((tmp_path / 'chunk').iterdir()) == []
+
+    # process() reports the error without leaving the output file behind
+    monkeypatch.setattr(segmenter, '_iter_segments', failing_segments)
+    segmenter.process()
+    assert list((tmp_path / 'chunk').iterdir()) == []
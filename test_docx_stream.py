@@ -0,0 +1,122 @@
+import zipfile
+
+import pytest
+
+from test_chunk import DocumentSegmenter
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+STYLES_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:styles xmlns:w="{W_NS}">
+  <w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/></w:style>
+  <w:style w:type="paragraph" w:styleId="Titre1"><w:name w:val="heading 1"/></w:style>
+  <w:style w:type="paragraph" w:styleId="Titre2"><w:name w:val="heading 2"/></w:style>
+</w:styles>
+"""
+
+# A text box, saved by Word both as a DrawingML shape (mc:Choice) and as a VML fallback (mc:Fallback)
+TEXT_BOX = """
+<w:r>
+  <mc:AlternateContent>
+    <mc:Choice Requires="wps">
+      <w:drawing><wp:anchor><a:graphic><a:graphicData><wps:wsp><wps:txbx><w:txbxContent>
+        <w:p><w:r><w:t>BOX</w:t></w:r></w:p>
+      </w:txbxContent></wps:txbx></wps:wsp></a:graphicData></a:graphic></wp:anchor></w:drawing>
+    </mc:Choice>
+    <mc:Fallback>
+      <w:pict><v:shape><v:textbox><w:txbxContent>
+        <w:p><w:r><w:t>BOX</w:t></w:r></w:p>
+      </w:txbxContent></v:textbox></v:shape></w:pict>
+    </mc:Fallback>
+  </mc:AlternateContent>
+</w:r>
+"""
+
+DOCUMENT_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="{W_NS}"
+    xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"
+    xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"
+    xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"
+    xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape"
+    xmlns:v="urn:schemas-microsoft-com:vml"
+    xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">
+  <w:body>
+    <w:p><w:pPr><w:pStyle w:val="Titre1"/></w:pPr><w:r><w:t>Main Title</w:t></w:r></w:p>
+    <w:p>
+      <w:r><w:t>line</w:t><w:br/><w:t xml:space="preserve">with newline </w:t></w:r>
+      <w:hyperlink r:id="rId1"><w:r><w:t>final</w:t></w:r></w:hyperlink>
+      {TEXT_BOX}
+    </w:p>
+    <w:tbl><w:tr><w:tc><w:p><w:r><w:t>cell</w:t></w:r></w:p></w:tc></w:tr></w:tbl>
+    <w:p><w:pPr><w:pStyle w:val="Titre2"/></w:pPr><w:r><w:t>Section</w:t></w:r></w:p>
+    <w:p><w:r><w:t>a</w:t><w:tab/><w:t>b</w:t></w:r></w:p>
+    <w:sectPr/>
+  </w:body>
+</w:document>
+"""
+
+
+REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+REL_TYPES = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+
+
+def _rels_xml(rel_type, target):
+    return (f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<Relationships xmlns="{REL_NS}">'
+            f'<Relationship Id="rId1" Type="{REL_TYPES}/{rel_type}" Target="{target}"/></Relationships>')
+
+
+def _make_docx(path, document_part='word/document.xml', styles_target='styles.xml'):
+    document_dir, document_name = document_part.rsplit('/', 1)
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr('_rels/.rels', _rels_xml('officeDocument', document_part))
+        archive.writestr(f'{document_dir}/_rels/{document_name}.rels', _rels_xml('styles', styles_target))
+        archive.writestr(document_part, DOCUMENT_XML)
+        archive.writestr(f'{document_dir}/{styles_target}', STYLES_XML)
+
+
+def test_docx_paragraphs_ignore_text_box_and_table_content(tmp_path):
+    docx_path = tmp_path / 'sample.docx'
+    _make_docx(docx_path)
+    segmenter = DocumentSegmenter(str(docx_path), str(tmp_path / 'chunk'))
+
+    assert list(segmenter._iter_docx_paragraphs()) == [
+        ('heading 1', 'Main Title'),
+        ('normal', 'line\nwith newline final'),
+        ('heading 2', 'Section'),
+        ('normal', 'a\tb'),
+    ]
+
+
+def test_docx_segments_use_localized_heading_styles(tmp_path):
+    docx_path = tmp_path / 'sample.docx'
+    _make_docx(docx_path)
+    segmenter = DocumentSegmenter(str(docx_path), str(tmp_path / 'chunk'))
+    segmenter._segment_document()
+
+    assert [(s.segment_type, s.importance, s.text) for s in segmenter.segments] == [
+        ('title', 2.0, 'Main Title'),
+        ('paragraph', 1.0, 'line\nwith newline final'),
+        ('subtitle', 1.8, 'Section'),
+        ('paragraph', 1.0, 'a\tb'),
+    ]
+
+
+def test_docx_parts_are_found_through_relationships(tmp_path):
+    # Word Online names the main part word/document2.xml
+    docx_path = tmp_path / 'sample.docx'
+    _make_docx(docx_path, document_part='word/document2.xml', styles_target='styles2.xml')
+    segmenter = DocumentSegmenter(str(docx_path), str(tmp_path / 'chunk'))
+
+    assert [style for style, _ in segmenter._iter_docx_paragraphs()] == [
+        'heading 1', 'normal', 'heading 2', 'normal'
+    ]
+
+
+def test_invalid_docx_is_reported_as_value_error(tmp_path):
+    docx_path = tmp_path / 'sample.docx'
+    docx_path.write_bytes(b'not a zip file')
+    segmenter = DocumentSegmenter(str(docx_path), str(tmp_path / 'chunk'))
+
+    with pytest.raises(ValueError, match='Error reading the DOCX file'):
+        list(segmenter._iter_docx_paragraphs())
+    segmenter.process()  # Reports the error instead of raising it
@@ -0,0 +1,24 @@
+import time
+
+from test_chunk import DocumentSegmenter
+
+
+def _headings(markdown_text):
+    segmenter = DocumentSegmenter.__new__(DocumentSegmenter)
+    return [(segment_type, text) for segment_type, _, text in segmenter._segment_pdf(markdown_text, [])
+            if segment_type != 'paragraph']
+
+
+def test_closing_hash_sequence_is_stripped():
+    assert _headings('# Title #\n## C# ##\n### C#\n## a #b\n') == [
+        ('title', 'Title'),
+        ('subtitle', 'C#'),
+        ('subtitle', 'C#'),
+        ('subtitle', 'a #b'),
+    ]
+
+
+def test_long_blank_run_in_heading_is_linear():
+    start = time.perf_counter()
+    assert _headings('# a' + ' ' * 40000 + 'x') == [('title', 'a' + ' ' * 40000 + 'x')]
+    assert time.perf_counter() - start < 1
@@ -0,0 +1,11 @@
+import pytest
+
+from test_chunk import DocumentSegmenter
+
+
+@pytest.mark.parametrize('page_workers', [None, 0, -2, 2.0, '4', True])
+def test_invalid_page_workers_are_rejected(tmp_path, page_workers):
+    txt_path = tmp_path / 'sample.txt'
+    txt_path.write_text('Title\n', encoding='utf-8')
+    with pytest.raises(ValueError, match='page_workers'):
+        DocumentSegmenter(str(txt_path), str(tmp_path / 'chunk'), page_workers=page_workers)
@@ -0,0 +1,10 @@
+import pytest
+
+from test_chunk import DocumentSegmenter
+
+
+@pytest.mark.parametrize('file_names', [('report.pdf', 'report.docx'), ('Report.pdf', 'a/report.pdf')])
+def test_inputs_sharing_a_base_name_are_rejected(tmp_path, file_names):
+    with pytest.raises(ValueError, match='report'):
+        DocumentSegmenter.process_many([str(tmp_path / name) for name in file_names], str(tmp_path / 'chunk'))
+    assert not (tmp_path / 'chunk').exists()